@@ -62,34 +62,32 @@ def main():
         print(f"Current balance: {primary_symbol}{summary['net_balance']:.2f}")
 
     elif args.command == 'view':
-        transactions = tracker.get_transactions()
-        
-        # Apply filters
-        if args.category:
-            transactions = [t for t in transactions if t['category'].lower() == args.category.lower()]
-        if args.type:
-            transactions = [t for t in transactions if t['type'] == args.type]
+        transactions = tracker.query(transaction_type=args.type, category=args.category or None)
         
         if not transactions:
             print("No transactions found.")
             return
         
-        print(f"\n{'Date':<12} {'Type':<8} {'Category':<15} {'Amount':<10}")
-        print("-" * 50)
+        # Collect the table and write it with one call instead of a print per row
+        lines = [
+            f"\n{'Date':<12} {'Type':<8} {'Category':<15} {'Amount':<10}",
+            "-" * 50
+        ]
         
         for transaction in transactions:
             date_str = transaction['date'][:10]
             currency = transaction.get('currency', 'USD')
             currency_symbol = tracker.get_currency_symbol(currency)
             amount_str = f"{currency_symbol}{transaction['amount']:.2f}"
-            print(f"{date_str:<12} {transaction['type']:<8} {transaction['category']:<15} {amount_str:<10}")
+            lines.append(f"{date_str:<12} {transaction['type']:<8} {transaction['category']:<15} {amount_str:<10}")
         
         total = sum(t['amount'] for t in transactions)
         # Use primary currency for total
         primary_currency = tracker.get_primary_currency()
         primary_symbol = tracker.get_currency_symbol(primary_currency)
-        print("-" * 50)
-        print(f"Total: {primary_symbol}{total:.2f}")
+        lines.append("-" * 50)
+        lines.append(f"Total: {primary_symbol}{total:.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif args.command == 'summary':
         summary = tracker.get_summary()
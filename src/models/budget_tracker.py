@@ -3,11 +3,151 @@ Budget Tracker Model - Phase 3: Transaction History & Data Persistence
 Handles transaction management, storage in memory, and file persistence
 """
 
+import copy
 import csv
+import io
 import json
-from datetime import datetime
-from typing import List, Dict, Any
-from pathlib import Path
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+try:
+    import orjson  # Optional: much faster JSON serialization for large exports
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streaming parser so large JSON histories aren't loaded whole
+except ImportError:
+    ijson = None
+
+# JSON files at least this large are streamed with ijson when it is installed
+JSON_STREAMING_THRESHOLD = 1024 * 1024
+
+# Sort keys for BudgetTracker.query, chosen once per sort instead of per row;
+# currency falls back to USD for records loaded without one
+_SORT_KEYS = {
+    'id': itemgetter('id'),
+    'date': itemgetter('date'),
+    'type': itemgetter('type'),
+    'category': itemgetter('category'),
+    'amount': itemgetter('amount'),
+    'currency': lambda transaction: transaction.get('currency', 'USD'),
+}
+
+
+# Display symbols per currency code, built once rather than on every lookup
+_CURRENCY_SYMBOLS = {
+    'USD': '$',
+    'EUR': '€',
+    'GBP': '£',
+    'JPY': '¥',
+    'CAD': 'C$',
+    'AUD': 'A$',
+    'CHF': '₣',
+    'CNY': '¥',
+    'INR': '₹',
+    'BRL': 'R$',
+    'PKR': '₨'
+}
+
+
+def _intern_currency(currency: Any) -> Any:
+    """
+    Intern currency codes so the rate lookups in convert_to_usd hash and
+    compare by identity; non-string values are returned unchanged
+    """
+    return sys.intern(currency) if isinstance(currency, str) else currency
+
+
+def _normalize_date(value: Any) -> Any:
+    """
+    Store UTC timestamps with an explicit '+00:00' offset instead of a trailing
+    'Z', so every stored date parses with datetime.fromisoformat without a
+    replace(); non-string values are returned unchanged
+    """
+    if isinstance(value, str) and value.endswith('Z'):
+        return value[:-1] + '+00:00'
+    return value
+
+
+def _json_transactions_prefix(filename: str) -> Optional[str]:
+    """
+    Find the ijson prefix of the transaction records in a JSON export
+    
+    Supports both the bare list format and the {'transactions': [...]} format;
+    returns None for any other top-level shape
+    """
+    with open(filename, 'rb') as jsonfile:
+        events = ijson.parse(jsonfile)
+        _, event, _ = next(events, (None, None, None))
+        if event == 'start_array':
+            return 'item'
+        if event != 'start_map':
+            return None
+        
+        # Walk the top-level keys until the 'transactions' value starts
+        for prefix, event, _ in events:
+            if prefix == 'transactions' and event != 'map_key':
+                return 'transactions.item' if event == 'start_array' else None
+            if prefix == '' and event == 'end_map':
+                return None
+    return None
+
+
+def _stream_json_transactions(filename: str, prefix: str):
+    """Yield transaction records found under prefix in a JSON export one at a time using ijson"""
+    with open(filename, 'rb') as jsonfile:
+        yield from ijson.items(jsonfile, prefix, use_float=True)
+
+
+def _position_by_id(transactions: List[Dict[str, Any]], transaction_id: int) -> int:
+    """
+    Binary-search a transaction list for transaction_id
+    
+    IDs are handed out in increasing order and lists only ever append or delete,
+    so self.transactions and every index list stay sorted by ID
+    """
+    low, high = 0, len(transactions)
+    while low < high:
+        mid = (low + high) // 2
+        if transactions[mid]['id'] < transaction_id:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def _write_json_atomic(filename: str, data: Any) -> None:
+    """
+    Write data as JSON to a temporary sibling file, then move it into place
+    
+    os.replace is atomic, so readers never observe a half-written file
+    """
+    # Serialize to bytes up front so the file is written with a single call
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, 'wb') as file:
+        file.write(payload)
+    os.replace(tmp_filename, filename)
+
+
+def _read_json(filename: str) -> Any:
+    """Read a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(filename, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(filename, 'r') as file:
+        return json.load(file)
 
 
 class BudgetTracker:
@@ -15,10 +155,33 @@ class BudgetTracker:
         """Initialize the budget tracker with empty transaction list"""
         self.transactions: List[Dict[str, Any]] = []
         
+        # Transaction lookup indexes, kept in sync with self.transactions
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)  # lower-cased keys
+        self._by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._category_counts: Counter = Counter()  # exact category name -> transaction count
+        self._next_id = 1
+        
+        # Bumped by every mutation of transactions or budget limits; used to
+        # invalidate cached aggregates
+        self._version = 0
+        self._budget_status_cache: Optional[Dict[str, Any]] = None
+        self._budget_status_key = None
+        self._summary_cache: Optional[Dict[str, float]] = None
+        self._summary_version = -1
+        self._sorted_views: Dict[str, List[Dict[str, Any]]] = {}  # order_by -> sorted transactions
+        self._sorted_views_version = -1
+        self._sorted_dates: List[str] = []  # dates of the 'date' view, for bisecting
+        self._sorted_dates_version = -1
+        
         # Default categories for Income and Expense
         self.income_categories = ["Salary", "Freelance", "Business", "Investment", "Gift", "Other Income"]
         self.expense_categories = ["Food", "Transportation", "Entertainment", "Bills", "Shopping", "Healthcare", "Education", "Other Expense"]
         
+        # Set mirrors of the category lists for O(1) membership checks;
+        # the lists keep display order
+        self._sync_category_sets()
+        
         # Budget Alert System - Phase 4 Feature 3
         self.budget_limits = {}  # {category: limit_amount}
         self.monthly_budget_limit = None
@@ -39,6 +202,15 @@ class BudgetTracker:
             "PKR": 278
         }
         
+        # Inverse rates (USD per unit of currency) so conversion is a multiply
+        self._inv_rates = {sys.intern(code): 1.0 / rate for code, rate in self.exchange_rates.items()}
+        
+        # Saves triggered by setters can be deferred with batch_updates(); the
+        # dirty flags record which files still need writing
+        self._save_deferral = 0
+        self._budget_settings_dirty = False
+        self._categories_dirty = False
+        
         # Load custom categories if they exist
         self.load_categories()
         
@@ -60,32 +232,83 @@ class BudgetTracker:
             True if transaction was added successfully, False otherwise
         """
         try:
-            # Validate inputs
-            if amount <= 0:
-                return False
-            if not category or not category.strip():
-                return False
-            if transaction_type not in ['Income', 'Expense']:
-                return False
-            
             # Use provided date or current date
             if transaction_date is None:
                 transaction_date = datetime.now().isoformat()
             
-            transaction = {
-                'amount': amount,
-                'category': category.strip(),
-                'type': transaction_type,
-                'currency': currency,
-                'date': transaction_date,
-                'id': len(self.transactions) + 1
-            }
+            transaction = self._build_transaction(amount, category, transaction_type, currency, transaction_date)
+            if transaction is None:
+                return False
             
-            self.transactions.append(transaction)
+            self._store_transaction(transaction)
             return True
         except Exception:
             return False
     
+    def add_transactions(self, rows: Iterable[Dict[str, Any]], rejected: Optional[List[int]] = None) -> int:
+        """
+        Add many transactions in one batch
+        
+        Each row uses the stored transaction keys: 'amount', 'category', 'type'
+        and optionally 'currency' (default 'USD') and 'date' (default now).
+        Rows that fail validation are skipped, as add_transaction would reject them.
+        
+        Args:
+            rows: Iterable of transaction mappings
+            rejected: Optional list that receives the position of each skipped row
+            
+        Returns:
+            Number of transactions added
+        """
+        # One timestamp for the whole batch instead of datetime.now() per row
+        now_iso = datetime.now().isoformat()
+        
+        new_transactions = []
+        for position, row in enumerate(rows):
+            try:
+                transaction = self._build_transaction(
+                    row['amount'],
+                    row['category'],
+                    row['type'],
+                    row.get('currency', 'USD'),
+                    row.get('date') or now_iso
+                )
+            except Exception:
+                transaction = None
+            if transaction is not None:
+                new_transactions.append(transaction)
+            elif rejected is not None:
+                rejected.append(position)
+        
+        for transaction in new_transactions:
+            self._store_transaction(transaction)
+        return len(new_transactions)
+    
+    def _build_transaction(self, amount: float, category: str, transaction_type: str, currency: str, transaction_date: str) -> Optional[Dict[str, Any]]:
+        """Validate inputs and build a transaction record (without ID); None if invalid"""
+        if amount <= 0:
+            return None
+        if not category or not category.strip():
+            return None
+        if transaction_type not in ['Income', 'Expense']:
+            return None
+        
+        return {
+            'amount': amount,
+            'category': category.strip(),
+            'type': transaction_type,
+            'currency': _intern_currency(currency),
+            'date': _normalize_date(transaction_date)
+        }
+    
+    def _store_transaction(self, transaction: Dict[str, Any]) -> None:
+        """Assign the next ID to a built transaction, append it and index it"""
+        transaction['id'] = self._next_id
+        self._next_id += 1
+        self.transactions.append(transaction)
+        self._index_transaction(transaction)
+        self._version += 1
+    
     def convert_to_usd(self, amount: float, currency: str) -> float:
         """
         Convert amount from given currency to USD
@@ -97,17 +320,24 @@ class BudgetTracker:
         Returns:
             Amount converted to USD
         """
-        if currency not in self.exchange_rates:
+        if currency == 'USD':
+            return abs(amount)
+        
+        inv_rate = self._inv_rates.get(currency)
+        if inv_rate is None:
             # Default to USD if currency not found
             return amount
         
-        # Convert to USD using: amount_in_usd = abs(amount) / exchange_rates[currency]
-        return abs(amount) / self.exchange_rates[currency]
+        # Convert to USD using: amount_in_usd = abs(amount) * (1 / exchange_rates[currency])
+        return abs(amount) * inv_rate
     
     def get_transactions(self) -> List[Dict[str, Any]]:
         """
         Get all transactions
         
+        Each transaction has 'id', 'date', 'amount', 'currency', 'category' and
+        'type', plus the derived 'amount_usd' (the amount converted to USD)
+        
         Returns:
             List of all transactions
         """
@@ -120,26 +350,27 @@ class BudgetTracker:
         Returns:
             Dictionary containing total_income, total_expenses, and net_balance in USD
         """
-        total_income_usd = 0.0
-        total_expenses_usd = 0.0
+        if self._summary_version == self._version:
+            return dict(self._summary_cache)
         
+        # USD amounts are cached on each transaction, so this is a plain sum per type
+        type_totals = defaultdict(float)
         for transaction in self.transactions:
-            # Convert amount to USD
-            amount_usd = self.convert_to_usd(transaction['amount'], transaction.get('currency', 'USD'))
-            
-            if transaction['type'] == 'Income':
-                total_income_usd += amount_usd
-            elif transaction['type'] == 'Expense':
-                # For expenses, treat as positive amounts in USD (we'll show as positive in summary)
-                total_expenses_usd += amount_usd
+            type_totals[transaction['type']] += transaction['amount_usd']
+        
+        total_income_usd = type_totals['Income']
+        # For expenses, treat as positive amounts in USD (we'll show as positive in summary)
+        total_expenses_usd = type_totals['Expense']
         
         net_balance_usd = total_income_usd - total_expenses_usd
         
-        return {
+        self._summary_cache = {
             'total_income': total_income_usd,
             'total_expenses': total_expenses_usd,
             'net_balance': net_balance_usd
         }
+        self._summary_version = self._version
+        return dict(self._summary_cache)
     
     def get_transactions_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
@@ -151,7 +382,7 @@ class BudgetTracker:
         Returns:
             List of transactions in the specified category
         """
-        return [t for t in self.transactions if t['category'].lower() == category.lower()]
+        return list(self._by_category.get(category.lower(), ()))
     
     def get_transactions_by_type(self, transaction_type: str) -> List[Dict[str, Any]]:
         """
@@ -163,7 +394,77 @@ class BudgetTracker:
         Returns:
             List of transactions of the specified type
         """
-        return [t for t in self.transactions if t['type'] == transaction_type]
+        return list(self._by_type.get(transaction_type, ()))
+    
+    def query(self, transaction_type: str = None, category: str = None, order_by: str = None, reverse: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get transactions filtered by type and/or category, optionally sorted
+        
+        Args:
+            transaction_type: 'Income' or 'Expense', or None for all types
+            category: Category to filter by (case-insensitive), or None for all
+            order_by: Transaction field to sort by, or None for insertion order
+            reverse: Sort in descending order
+            
+        Returns:
+            List of matching transactions
+        """
+        if order_by is not None:
+            source = self._sorted_view(order_by)
+        elif category is not None:
+            source = self._by_category.get(category.lower(), ())
+        elif transaction_type is not None:
+            source = self._by_type.get(transaction_type, ())
+        else:
+            source = self.transactions
+        
+        if category is not None:
+            category = category.lower()
+            result = [t for t in source if t['category'].lower() == category
+                      and (transaction_type is None or t['type'] == transaction_type)]
+        elif transaction_type is not None and order_by is not None:
+            result = [t for t in source if t['type'] == transaction_type]
+        else:
+            result = list(source)
+        
+        if reverse:
+            result.reverse()
+        return result
+    
+    def _sorted_view(self, order_by: str) -> List[Dict[str, Any]]:
+        """Get all transactions sorted by a field, cached until the next mutation"""
+        if self._sorted_views_version != self._version:
+            self._sorted_views = {}
+            self._sorted_views_version = self._version
+        view = self._sorted_views.get(order_by)
+        if view is None:
+            key = _SORT_KEYS.get(order_by) or itemgetter(order_by)
+            view = self._sorted_views[order_by] = sorted(self.transactions, key=key)
+        return view
+    
+    def get_transactions_between(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """
+        Get transactions dated within a range, in date order
+        
+        ISO-8601 dates sort as strings, so the range is found by binary search
+        over the cached date-sorted view instead of scanning every transaction
+        
+        Args:
+            start_date: Earliest ISO date or timestamp to include
+            end_date: Latest ISO date or timestamp to include; dates starting with
+                it also match, so a bare 'YYYY-MM-DD' covers that whole day
+            
+        Returns:
+            List of transactions in the range, sorted by date
+        """
+        view = self._sorted_view('date')
+        if self._sorted_dates_version != self._version:
+            self._sorted_dates = [transaction['date'] for transaction in view]
+            self._sorted_dates_version = self._version
+        
+        low = bisect_left(self._sorted_dates, start_date)
+        high = bisect_right(self._sorted_dates, end_date + '\uffff')
+        return view[low:high]
     
     def remove_transaction(self, transaction_id: int) -> bool:
         """
@@ -175,20 +476,56 @@ class BudgetTracker:
         Returns:
             True if transaction was removed, False if not found
         """
-        for i, transaction in enumerate(self.transactions):
-            if transaction['id'] == transaction_id:
-                self.transactions.pop(i)
-                return True
-        return False
+        transaction = self._by_id.pop(transaction_id, None)
+        if transaction is None:
+            return False
+        # Each list is sorted by ID, so the entry is found by bisection instead
+        # of a linear scan comparing whole dicts
+        for items in (
+            self.transactions,
+            self._by_category[transaction['category'].lower()],
+            self._by_type[transaction['type']]
+        ):
+            del items[_position_by_id(items, transaction_id)]
+        self._category_counts[transaction['category']] -= 1
+        self._version += 1
+        return True
     
     def clear_all_transactions(self) -> None:
         """Clear all transactions"""
         self.transactions.clear()
+        self._rebuild_indexes()
+    
+    def _index_transaction(self, transaction: Dict[str, Any]) -> None:
+        """Add a single transaction to the lookup indexes and cache its USD amount"""
+        # Rates are fixed for the tracker's lifetime, so the conversion is done
+        # once here instead of on every summary, status or export
+        transaction['amount_usd'] = self.convert_to_usd(transaction['amount'], transaction.get('currency', 'USD'))
+        self._by_id[transaction['id']] = transaction
+        self._by_category[transaction['category'].lower()].append(transaction)
+        self._by_type[transaction['type']].append(transaction)
+        self._category_counts[transaction['category']] += 1
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild lookup indexes after self.transactions is replaced wholesale"""
+        self._by_id = {}
+        self._by_category = defaultdict(list)
+        self._by_type = defaultdict(list)
+        self._category_counts = Counter()
+        for transaction in self.transactions:
+            self._index_transaction(transaction)
+        self._next_id = max(self._by_id, default=0) + 1
+        self._version += 1
     
     def get_transaction_count(self) -> int:
         """Get total number of transactions"""
         return len(self.transactions)
     
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation; equal versions mean unchanged data"""
+        return self._version
+    
     def get_categories(self) -> List[str]:
         """
         Get list of unique categories used in transactions
@@ -211,20 +548,7 @@ class BudgetTracker:
         Returns:
             Currency symbol
         """
-        currency_symbols = {
-            'USD': '$',
-            'EUR': '€',
-            'GBP': '£',
-            'JPY': '¥',
-            'CAD': 'C$',
-            'AUD': 'A$',
-            'CHF': '₣',
-            'CNY': '¥',
-            'INR': '₹',
-            'BRL': 'R$',
-            'PKR': '₨'
-        }
-        return currency_symbols.get(currency_code, '$')
+        return _CURRENCY_SYMBOLS.get(currency_code, '$')
     
     def get_primary_currency(self) -> str:
         """
@@ -236,12 +560,8 @@ class BudgetTracker:
         if not self.transactions:
             return 'USD'
         
-        currency_counts = {}
-        for transaction in self.transactions:
-            currency = transaction.get('currency', 'USD')
-            currency_counts[currency] = currency_counts.get(currency, 0) + 1
-        
-        return max(currency_counts, key=currency_counts.get)
+        currency_counts = Counter(transaction.get('currency', 'USD') for transaction in self.transactions)
+        return currency_counts.most_common(1)[0][0]
     
     def save_to_csv(self, filename: str) -> bool:
         """
@@ -254,23 +574,28 @@ class BudgetTracker:
             True if successful, False otherwise
         """
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['date', 'amount', 'currency', 'category', 'type', 'usd_value']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for transaction in self.transactions:
-                    # Calculate USD equivalent for export
-                    usd_value = self.convert_to_usd(transaction['amount'], transaction.get('currency', 'USD'))
-                    
-                    writer.writerow({
-                        'date': transaction['date'],
-                        'amount': transaction['amount'],
-                        'currency': transaction.get('currency', 'USD'),
-                        'category': transaction['category'],
-                        'type': transaction['type'],
-                        'usd_value': round(usd_value, 2)
-                    })
+            # Format the whole document in memory, then hand it to the OS in one write
+            buffer = io.StringIO(newline='')
+            fieldnames = ['date', 'amount', 'currency', 'category', 'type', 'usd_value']
+            writer = csv.writer(buffer)
+            
+            writer.writerow(fieldnames)
+            # Plain tuples in a generator: no per-row dict build or field reordering
+            writer.writerows(
+                (
+                    t['date'],
+                    t['amount'],
+                    t.get('currency', 'USD'),
+                    t['category'],
+                    t['type'],
+                    # USD equivalent for export
+                    round(t['amount_usd'], 2)
+                )
+                for t in self.transactions
+            )
+            
+            with open(filename, 'wb') as csvfile:
+                csvfile.write(buffer.getvalue().encode('utf-8'))
             return True
         except Exception as e:
             print(f"Error saving to CSV: {e}")
@@ -287,25 +612,36 @@ class BudgetTracker:
             True if successful, False otherwise
         """
         try:
+            transactions_data = []
+            currencies_used = set()
+            
+            # Single pass: collect currencies while building the export rows
+            for transaction in self.transactions:
+                currency = transaction.get('currency', 'USD')
+                currencies_used.add(currency)
+                
+                # Export the cached USD amount under its public 'usd_value' name
+                row = {**transaction, 'usd_value': round(transaction['amount_usd'], 2)}
+                del row['amount_usd']
+                transactions_data.append(row)
+            
             data = {
-                'transactions': [],
+                'transactions': transactions_data,
                 'metadata': {
                     'export_date': datetime.now().isoformat(),
                     'total_transactions': len(self.transactions),
-                    'currencies_used': list(set(t.get('currency', 'USD') for t in self.transactions))
+                    'currencies_used': list(currencies_used)
                 }
             }
             
-            for transaction in self.transactions:
-                # Add USD equivalent to each transaction
-                usd_value = self.convert_to_usd(transaction['amount'], transaction.get('currency', 'USD'))
-                
-                transaction_data = transaction.copy()
-                transaction_data['usd_value'] = round(usd_value, 2)
-                data['transactions'].append(transaction_data)
+            # Serialize fully before opening the file, then write it in one call
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
             
-            with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as jsonfile:
+                jsonfile.write(payload)
             return True
         except Exception as e:
             print(f"Error saving to JSON: {e}")
@@ -322,32 +658,41 @@ class BudgetTracker:
             True if successful, False otherwise
         """
         try:
-            if not Path(filename).exists():
-                return False
-            
             loaded_transactions = []
             with open(filename, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
+                reader = csv.reader(csvfile)
+                
+                # Resolve column positions once from the header instead of
+                # building a dict per row
+                header = next(reader, None) or []
+                columns = {name: index for index, name in enumerate(header)}
                 
-                for row in reader:
-                    # Validate required fields
-                    required_fields = ['date', 'amount', 'category', 'type']
-                    if not all(field in row for field in required_fields):
-                        continue
+                # Validate required fields
+                required_fields = ['date', 'amount', 'category', 'type']
+                if all(field in columns for field in required_fields):
+                    date_col, amount_col, category_col, type_col = (columns[field] for field in required_fields)
+                    currency_col = columns.get('currency')
                     
-                    transaction = {
-                        'date': row['date'],
-                        'amount': float(row['amount']),
-                        'currency': row.get('currency', 'USD'),
-                        'category': row['category'],
-                        'type': row['type'],
-                        'id': len(loaded_transactions) + 1
-                    }
-                    loaded_transactions.append(transaction)
+                    for row in reader:
+                        if not row:
+                            continue  # Skip blank lines, as DictReader did
+                        
+                        transaction = {
+                            'date': _normalize_date(row[date_col]),
+                            'amount': float(row[amount_col]),
+                            'currency': _intern_currency(row[currency_col]) if currency_col is not None else 'USD',
+                            'category': row[category_col],
+                            'type': row[type_col],
+                            'id': len(loaded_transactions) + 1
+                        }
+                        loaded_transactions.append(transaction)
             
             # Replace current transactions
             self.transactions = loaded_transactions
+            self._rebuild_indexes()
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error loading from CSV: {e}")
             return False
@@ -363,19 +708,23 @@ class BudgetTracker:
             True if successful, False otherwise
         """
         try:
-            if not Path(filename).exists():
-                return False
-            
-            with open(filename, 'r', encoding='utf-8') as jsonfile:
-                data = json.load(jsonfile)
-            
-            # Handle both simple list format and structured format
-            if isinstance(data, list):
-                transactions_data = data
-            elif isinstance(data, dict) and 'transactions' in data:
-                transactions_data = data['transactions']
+            if ijson is not None and os.path.getsize(filename) >= JSON_STREAMING_THRESHOLD:
+                # Stream records so the whole document is never held in memory
+                prefix = _json_transactions_prefix(filename)
+                if prefix is None:
+                    return False
+                transactions_data = _stream_json_transactions(filename, prefix)
             else:
-                return False
+                with open(filename, 'r', encoding='utf-8') as jsonfile:
+                    data = json.load(jsonfile)
+                
+                # Handle both simple list format and structured format
+                if isinstance(data, list):
+                    transactions_data = data
+                elif isinstance(data, dict) and 'transactions' in data:
+                    transactions_data = data['transactions']
+                else:
+                    return False
             
             loaded_transactions = []
             for transaction_data in transactions_data:
@@ -385,9 +734,9 @@ class BudgetTracker:
                     continue
                 
                 transaction = {
-                    'date': transaction_data['date'],
+                    'date': _normalize_date(transaction_data['date']),
                     'amount': float(transaction_data['amount']),
-                    'currency': transaction_data.get('currency', 'USD'),
+                    'currency': _intern_currency(transaction_data.get('currency', 'USD')),
                     'category': transaction_data['category'],
                     'type': transaction_data['type'],
                     'id': len(loaded_transactions) + 1
@@ -396,7 +745,10 @@ class BudgetTracker:
             
             # Replace current transactions
             self.transactions = loaded_transactions
+            self._rebuild_indexes()
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error loading from JSON: {e}")
             return False
@@ -435,18 +787,34 @@ class BudgetTracker:
             return False
         
         if transaction_type == "Income":
-            if category_name not in self.income_categories:
+            if category_name not in self._income_set:
                 self.income_categories.append(category_name)
-                self.save_categories()
+                self._income_set.add(category_name)
+                self._categories_changed()
                 return True
         elif transaction_type == "Expense":
-            if category_name not in self.expense_categories:
+            if category_name not in self._expense_set:
                 self.expense_categories.append(category_name)
-                self.save_categories()
+                self._expense_set.add(category_name)
+                self._categories_changed()
                 return True
         
         return False  # Category already exists
     
+    def add_categories(self, category_names: Iterable[str], transaction_type: str) -> int:
+        """
+        Add several custom categories, saving the category file once
+        
+        Args:
+            category_names: Names of the new categories
+            transaction_type: 'Income' or 'Expense'
+            
+        Returns:
+            Number of categories added; blank and existing names are skipped
+        """
+        with self.batch_updates():
+            return sum(self.add_category(name, transaction_type) for name in category_names)
+    
     def remove_category(self, category_name: str, transaction_type: str) -> bool:
         """
         Remove a custom category
@@ -462,20 +830,36 @@ class BudgetTracker:
         if self.is_category_in_use(category_name):
             return False  # Cannot remove category that's in use
         
-        if transaction_type == "Income" and category_name in self.income_categories:
+        if transaction_type == "Income" and category_name in self._income_set:
             self.income_categories.remove(category_name)
-            self.save_categories()
+            self._income_set.discard(category_name)
+            self._categories_changed()
             return True
-        elif transaction_type == "Expense" and category_name in self.expense_categories:
+        elif transaction_type == "Expense" and category_name in self._expense_set:
             self.expense_categories.remove(category_name)
-            self.save_categories()
+            self._expense_set.discard(category_name)
+            self._categories_changed()
             return True
         
         return False
     
+    def _sync_category_sets(self) -> None:
+        """Rebuild the category membership sets from the category lists"""
+        self._income_set = set(self.income_categories)
+        self._expense_set = set(self.expense_categories)
+    
+    def get_used_categories(self) -> List[str]:
+        """
+        Get the categories that currently have transactions
+        
+        Returns:
+            Sorted list of category names in use
+        """
+        return sorted(name for name, count in self._category_counts.items() if count > 0)
+    
     def is_category_in_use(self, category_name: str) -> bool:
         """Check if a category is being used in any transactions"""
-        return any(transaction['category'] == category_name for transaction in self.transactions)
+        return self._category_counts[category_name] > 0
     
     def save_categories(self) -> bool:
         """Save custom categories to a JSON file"""
@@ -485,8 +869,8 @@ class BudgetTracker:
                 'expense_categories': self.expense_categories
             }
             
-            with open('categories.json', 'w') as file:
-                json.dump(categories_data, file, indent=2)
+            _write_json_atomic('categories.json', categories_data)
+            self._categories_dirty = False
             return True
         except Exception as e:
             print(f"Error saving categories: {e}")
@@ -495,66 +879,74 @@ class BudgetTracker:
     def load_categories(self) -> bool:
         """Load custom categories from JSON file"""
         try:
-            categories_file = Path('categories.json')
-            if not categories_file.exists():
-                return False
-            
-            with open('categories.json', 'r') as file:
-                categories_data = json.load(file)
+            categories_data = _read_json('categories.json')
             
             # Load categories if they exist in the file
             if 'income_categories' in categories_data:
                 self.income_categories = categories_data['income_categories']
             if 'expense_categories' in categories_data:
                 self.expense_categories = categories_data['expense_categories']
+            self._sync_category_sets()
             
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error loading categories: {e}")
             return False
     
     # Phase 4 Feature 3: Budget Alerts System
-    def set_monthly_budget(self, limit: float) -> None:
-        """Set monthly spending limit"""
+    def set_monthly_budget(self, limit: float) -> bool:
+        """Set monthly spending limit; returns True only if the value changed"""
+        if limit == self.monthly_budget_limit:
+            return False
         self.monthly_budget_limit = limit
-        self.save_budget_settings()
+        self._version += 1
+        self._budget_settings_changed()
+        return True
     
-    def set_weekly_budget(self, limit: float) -> None:
-        """Set weekly spending limit"""
+    def set_weekly_budget(self, limit: float) -> bool:
+        """Set weekly spending limit; returns True only if the value changed"""
+        if limit == self.weekly_budget_limit:
+            return False
         self.weekly_budget_limit = limit
-        self.save_budget_settings()
+        self._version += 1
+        self._budget_settings_changed()
+        return True
     
-    def set_category_budget(self, category: str, limit: float) -> None:
-        """Set budget limit for a specific category"""
+    def set_category_budget(self, category: str, limit: float) -> bool:
+        """Set budget limit for a category; returns True only if the value changed"""
+        if self.budget_limits.get(category) == limit:
+            return False
         self.budget_limits[category] = limit
-        self.save_budget_settings()
+        self._version += 1
+        self._budget_settings_changed()
+        return True
     
     def remove_category_budget(self, category: str) -> bool:
         """Remove budget limit for a category"""
         if category in self.budget_limits:
             del self.budget_limits[category]
-            self.save_budget_settings()
+            self._version += 1
+            self._budget_settings_changed()
             return True
         return False
     
     def get_budget_status(self) -> Dict[str, Any]:
-        """Get current budget status and alerts"""
-        from datetime import datetime, timedelta
+        """
+        Get current budget status and alerts
         
+        The result is memoized per (mutation version, current minute), so repeated
+        refreshes between edits return the cached status; each call gets its own
+        copy, so callers can't modify the cache
+        """
         now = datetime.now()
+        cache_key = (self._version, now.replace(second=0, microsecond=0))
+        if cache_key == self._budget_status_key:
+            return copy.deepcopy(self._budget_status_cache)
         
-        # Get current month expenses
-        current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        monthly_expenses = self._get_expenses_in_period(current_month_start, now)
-        
-        # Get current week expenses (Monday to Sunday)
-        days_since_monday = now.weekday()
-        current_week_start = now - timedelta(days=days_since_monday)
-        current_week_start = current_week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        weekly_expenses = self._get_expenses_in_period(current_week_start, now)
-        
-        # Get category expenses for current month
-        category_expenses = self._get_category_expenses_current_month()
+        # Monthly, weekly and per-category totals come from a single pass
+        monthly_expenses, weekly_expenses, category_expenses = self._compute_period_stats(now)
         
         alerts = []
         
@@ -608,46 +1000,68 @@ class BudgetTracker:
                         'severity': 'warning'
                     })
         
-        return {
+        # Bucket alerts by severity once so callers don't filter the list per severity
+        alerts_by_severity = {'critical': [], 'warning': []}
+        for alert in alerts:
+            alerts_by_severity[alert['severity']].append(alert)
+        
+        self._budget_status_cache = {
             'monthly_spent': monthly_expenses,
             'monthly_limit': self.monthly_budget_limit,
             'weekly_spent': weekly_expenses,
             'weekly_limit': self.weekly_budget_limit,
             'category_expenses': category_expenses,
             'category_limits': self.budget_limits.copy(),
-            'alerts': alerts
+            'alerts': alerts,
+            'alerts_by_severity': alerts_by_severity
         }
+        self._budget_status_key = cache_key
+        return copy.deepcopy(self._budget_status_cache)
     
-    def _get_expenses_in_period(self, start_date: datetime, end_date: datetime) -> float:
-        """Get total expenses in USD for a specific period"""
-        total = 0
-        for transaction in self.transactions:
-            if transaction['type'] == 'Expense':
-                transaction_date = datetime.fromisoformat(transaction['date'].replace('Z', '+00:00'))
-                if start_date <= transaction_date <= end_date:
-                    # Convert to USD for budget comparison
-                    usd_amount = self.convert_to_usd(transaction['amount'], transaction.get('currency', 'USD'))
-                    total += usd_amount
-        return total
-    
-    def _get_category_expenses_current_month(self) -> Dict[str, float]:
-        """Get expenses by category for current month in USD"""
-        from datetime import datetime
+    def _compute_period_stats(self, now: datetime) -> Tuple[float, float, Dict[str, float]]:
+        """
+        Compute current-period expense totals in USD with one pass over transactions
         
-        now = datetime.now()
-        current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        Args:
+            now: Reference time; the month and week windows end here
+            
+        Returns:
+            Tuple of (monthly_total, weekly_total, category_totals) where
+            category_totals covers expenses since the start of the month
+        """
+        # ISO-8601 strings sort chronologically, so the period bounds are compared
+        # as strings and no transaction date is parsed. Both starts fall on
+        # midnight, so comparing the 'YYYY-MM-DD' prefix is exact.
+        month_start = now.strftime('%Y-%m-01')
+        # Current week runs Monday to Sunday
+        week_start = (now - timedelta(days=now.weekday())).strftime('%Y-%m-%d')
+        now_iso = now.isoformat()
+        
+        monthly_total = 0.0
+        weekly_total = 0.0
+        category_totals = defaultdict(float)
         
-        category_totals = {}
         for transaction in self.transactions:
-            if transaction['type'] == 'Expense':
-                transaction_date = datetime.fromisoformat(transaction['date'].replace('Z', '+00:00'))
-                if transaction_date >= current_month_start:
-                    category = transaction['category']
-                    # Convert to USD for budget comparison
-                    usd_amount = self.convert_to_usd(transaction['amount'], transaction.get('currency', 'USD'))
-                    category_totals[category] = category_totals.get(category, 0) + usd_amount
+            if transaction['type'] != 'Expense':
+                continue
+            
+            transaction_date = transaction['date']
+            transaction_day = transaction_date[:10]
+            if transaction_day < month_start and transaction_day < week_start:
+                continue
+            
+            # USD amount cached at insert for budget comparison
+            usd_amount = transaction['amount_usd']
+            not_future = transaction_date <= now_iso
+            
+            if transaction_day >= month_start:
+                category_totals[transaction['category']] += usd_amount
+                if not_future:
+                    monthly_total += usd_amount
+            if transaction_day >= week_start and not_future:
+                weekly_total += usd_amount
         
-        return category_totals
+        return monthly_total, weekly_total, dict(category_totals)
     
     def save_budget_settings(self) -> bool:
         """Save budget settings to a JSON file"""
@@ -658,8 +1072,8 @@ class BudgetTracker:
                 'category_limits': self.budget_limits
             }
             
-            with open('budget_settings.json', 'w') as file:
-                json.dump(budget_data, file, indent=2)
+            _write_json_atomic('budget_settings.json', budget_data)
+            self._budget_settings_dirty = False
             return True
         except Exception as e:
             print(f"Error saving budget settings: {e}")
@@ -668,18 +1082,58 @@ class BudgetTracker:
     def load_budget_settings(self) -> bool:
         """Load budget settings from JSON file"""
         try:
-            budget_file = Path('budget_settings.json')
-            if not budget_file.exists():
-                return False
-            
-            with open('budget_settings.json', 'r') as file:
-                budget_data = json.load(file)
+            budget_data = _read_json('budget_settings.json')
             
             self.monthly_budget_limit = budget_data.get('monthly_budget_limit')
             self.weekly_budget_limit = budget_data.get('weekly_budget_limit')
             self.budget_limits = budget_data.get('category_limits', {})
+            self._version += 1
             
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error loading budget settings: {e}")
             return False
+    
+    def _budget_settings_changed(self) -> None:
+        """Mark budget settings as modified and save them unless saves are deferred"""
+        self._budget_settings_dirty = True
+        if not self._save_deferral:
+            self.save_budget_settings()
+    
+    def _categories_changed(self) -> None:
+        """Mark categories as modified and save them unless saves are deferred"""
+        self._categories_dirty = True
+        if not self._save_deferral:
+            self.save_categories()
+    
+    @contextmanager
+    def batch_updates(self):
+        """
+        Defer budget settings and category saves until the block exits
+        
+        Each file is then written at most once, however many changes were made
+        inside the block. Blocks may be nested; only the outermost one saves.
+        """
+        self._save_deferral += 1
+        try:
+            yield self
+        finally:
+            self._save_deferral -= 1
+            if not self._save_deferral:
+                self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Save budget settings and categories changed since their last save
+        
+        Returns:
+            True if every pending save succeeded (or nothing was pending)
+        """
+        success = True
+        if self._budget_settings_dirty:
+            success = self.save_budget_settings() and success
+        if self._categories_dirty:
+            success = self.save_categories() and success
+        return success
@@ -6,4 +6,14 @@ def read_file(file_path):
 def write_file(file_path, data):
     """Writes data to a file."""
     with open(file_path, 'w') as file:
-        file.write(data)
\ No newline at end of file
+        file.write(data)
+
+def iter_lines(file_path, buffer_size=1 << 20):
+    """Yields the lines of a file one at a time without reading it all into memory."""
+    with open(file_path, 'r', encoding='utf-8', buffering=buffer_size) as file:
+        yield from file
+
+def write_chunks(file_path, chunks, buffer_size=1 << 20):
+    """Writes an iterable of strings to a file without joining them first."""
+    with open(file_path, 'w', encoding='utf-8', buffering=buffer_size) as file:
+        file.writelines(chunks)
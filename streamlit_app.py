@@ -5,6 +5,7 @@ A modern, browser-based personal finance management tool
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, date
@@ -21,10 +22,94 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 # Import backend logic
 try:
     from models.budget_tracker import BudgetTracker
+    from utils.file_handler import iter_lines
 except ImportError:
     st.error("Backend modules not found. Please ensure the src/models directory exists.")
     st.stop()
 
+# Arrow-backed DataFrames need pandas 2 and the optional pyarrow package
+try:
+    import pyarrow  # noqa: F401
+    ARROW_BACKEND = int(pd.__version__.split('.')[0]) >= 2
+except ImportError:
+    ARROW_BACKEND = False
+
+# Money formatters bound once; render paths call these instead of re-parsing
+# an f-string format spec for every value
+format_usd = "${:,.2f}".format
+format_usd_plain = "${:.2f}".format
+format_amount = "{:,.2f}".format
+
+# Transaction fields pulled into the per-rerun DataFrame
+TRANSACTION_COLUMNS = ['id', 'date', 'type', 'category', 'amount', 'currency', 'amount_usd']
+
+# Rows shown per page of the transaction history table
+HISTORY_PAGE_SIZE = 100
+
+# Balance trends longer than this are downsampled before plotting
+TREND_MAX_POINTS = 5000
+TREND_DOWNSAMPLED_POINTS = 2000
+
+# Append-only transaction log, replayed on startup so data survives new sessions.
+# The app is single-user: every browser session shares and replays this one file
+TRANSACTIONS_LOG = "transactions.jsonl"
+
+# Text columns of an imported CSV are read as strings instead of being
+# type-inferred; Amount is coerced separately so one bad cell only drops its row
+IMPORT_DTYPES = {'Type': str, 'Category': str, 'Currency': str, 'Date': str}
+
+# Exports with more rows than this are offered gzip-compressed
+EXPORT_GZIP_THRESHOLD = 10000
+
+
+def lttb_indices(values: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick the indices of a series that best preserve its shape
+    (Largest-Triangle-Three-Buckets), always keeping the first and last point
+    
+    Args:
+        values: Series values, plotted at evenly spaced positions
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(values)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    positions = np.arange(n, dtype=np.float64)
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        
+        # Average of the next bucket, or the last point for the final bucket
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+            avg_x = positions[next_start:next_stop].mean()
+            avg_y = values[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = positions[-1], values[-1]
+        
+        # Keep the point forming the largest triangle with the previous pick
+        # and the next bucket's average
+        prev_x, prev_y = positions[selected], values[selected]
+        areas = np.abs(
+            (prev_x - avg_x) * (values[start:stop] - prev_y)
+            - (prev_x - positions[start:stop]) * (avg_y - prev_y)
+        )
+        selected = start + int(areas.argmax())
+        indices[bucket + 1] = selected
+    
+    return indices
+
 # Page configuration
 st.set_page_config(
     page_title="Budget Tracker Pro",
@@ -34,7 +119,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -63,11 +148,103 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# Chart builders are cached on their inputs, so reruns triggered by unrelated
+# widgets reuse the figure instead of rebuilding it
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_expenses_pie_chart(frame: pd.DataFrame) -> Optional[go.Figure]:
+    """Build the expenses-by-category pie chart, or None if there are no expenses"""
+    # Group by category in USD, dropping categories with nothing to show
+    expenses = frame.loc[frame['type'] == 'Expense']
+    expense_by_category = expenses.groupby('category', sort=False)['usd'].sum()
+    expense_by_category = expense_by_category[expense_by_category > 0]
+    if expense_by_category.empty:
+        return None
+    
+    fig = px.pie(
+        values=expense_by_category.to_numpy(),
+        names=expense_by_category.index,
+        title="Expenses by Category (USD)",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_income_expense_bar_chart(income_total: float, expense_total: float) -> go.Figure:
+    """Build the income vs expenses bar chart"""
+    fig = go.Figure(data=[
+        go.Bar(
+            name='Income',
+            x=['Financial Overview'],
+            y=[income_total],
+            marker_color='lightgreen'
+        ),
+        go.Bar(
+            name='Expenses',
+            x=['Financial Overview'],
+            y=[expense_total],
+            marker_color='lightcoral'
+        )
+    ])
+    
+    fig.update_layout(
+        title="Income vs Expenses (USD)",
+        barmode='group',
+        height=500,
+        yaxis_title="Amount (USD)"
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_balance_trend_chart(sorted_frame: pd.DataFrame) -> go.Figure:
+    """Build the running balance line chart from date-sorted transactions"""
+    # Calculate running balance: income adds, everything else subtracts
+    signed_usd = sorted_frame['usd'].where(sorted_frame['type'] == 'Income', -sorted_frame['usd'])
+    
+    df_chart = pd.DataFrame({
+        'Date': sorted_frame['date'].to_numpy(),
+        'Balance': signed_usd.cumsum().to_numpy()
+    })
+    
+    # Large histories stall the browser; plot a shape-preserving subset
+    if len(df_chart) > TREND_MAX_POINTS:
+        keep = lttb_indices(df_chart['Balance'].to_numpy(), TREND_DOWNSAMPLED_POINTS)
+        df_chart = df_chart.iloc[keep]
+    fig = px.line(
+        df_chart,
+        x='Date',
+        y='Balance',
+        title="Balance Trend Over Time (USD)"
+    )
+    
+    fig.update_traces(line_color='#1f77b4', line_width=3)
+    fig.update_layout(height=500)
+    fig.update_xaxes(title_text="Date")
+    fig.update_yaxes(title_text="Balance (USD)")
+    
+    # Add zero line
+    fig.add_hline(y=0, line_dash="dash", line_color="red", opacity=0.5)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_export_csv(df: pd.DataFrame, compress: bool) -> bytes:
+    """Serialize the export DataFrame to CSV bytes, gzip-compressed if requested"""
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, compression='gzip' if compress else None)
+    return buffer.getvalue()
 
 class StreamlitBudgetTracker:
     """Streamlit wrapper for the Budget Tracker application"""
     
+    # Widget options shared by every rerun instead of rebuilt as list literals
+    CURRENCIES = ("USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR", "BRL", "PKR")
+    TRANSACTION_TYPES = ("Income", "Expense")
+    
     def __init__(self):
         # Initialize session state
         self.init_session_state()
@@ -78,7 +255,9 @@ class StreamlitBudgetTracker:
     def init_session_state(self):
         """Initialize Streamlit session state variables"""
         if 'budget_tracker' not in st.session_state:
-            st.session_state.budget_tracker = BudgetTracker()
+            tracker = BudgetTracker()
+            self.load_transaction_log(tracker)
+            st.session_state.budget_tracker = tracker
         
         if 'base_currency' not in st.session_state:
             st.session_state.base_currency = "USD"
@@ -88,6 +267,9 @@ class StreamlitBudgetTracker:
         
         if 'filter_category' not in st.session_state:
             st.session_state.filter_category = "All"
+        
+        if 'imported_file_ids' not in st.session_state:
+            st.session_state.imported_file_ids = set()
     
     def load_tracker(self):
         """Load the budget tracker from session state"""
@@ -97,22 +279,108 @@ class StreamlitBudgetTracker:
         """Save the budget tracker to session state"""
         st.session_state.budget_tracker = self.tracker
 
+    def load_transaction_log(self, tracker):
+        """Replay the on-disk transaction log into a fresh tracker, skipping unreadable lines"""
+        unreadable = 0
+        
+        def records():
+            nonlocal unreadable
+            for line in iter_lines(TRANSACTIONS_LOG):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # e.g. a line torn by a crash mid-append; keep the rest of the history
+                    unreadable += 1
+        
+        try:
+            tracker.add_transactions(records())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            st.warning(f"Could not load saved transactions: {e}")
+        
+        if unreadable:
+            st.warning(f"Skipped {unreadable} unreadable line(s) in saved transactions")
+
+    def append_to_transaction_log(self, count):
+        """Append the last `count` added transactions to the on-disk log"""
+        if count <= 0:
+            return
+        try:
+            with open(TRANSACTIONS_LOG, 'ab+') as file:
+                # Terminate a torn last line so it doesn't swallow the first new record
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b'\n':
+                        file.write(b'\n')
+                
+                # amount_usd is derived, and recomputed when the log is replayed
+                file.writelines(
+                    (json.dumps({k: v for k, v in t.items() if k != 'amount_usd'}) + '\n').encode('utf-8')
+                    for t in self.tracker.transactions[-count:]
+                )
+        except OSError as e:
+            st.warning(f"Could not save transactions: {e}")
+
+    def reset_transaction_log(self):
+        """Truncate the on-disk transaction log"""
+        try:
+            open(TRANSACTIONS_LOG, 'w', encoding='utf-8').close()
+        except OSError as e:
+            st.warning(f"Could not reset saved transactions: {e}")
+
     def render_header(self):
         """Render the application header"""
         st.markdown('<h1 class="main-header">💰 Budget Tracker Pro</h1>', unsafe_allow_html=True)
         st.markdown("---")
 
-    def render_sidebar(self):
+    def get_transactions_frame(self):
+        """
+        Get the DataFrame shared by every render path, with a 'usd' column
+        
+        The frame and its date-sorted view are cached in session state until
+        the tracker's data version changes, so reruns that only touch widgets
+        reuse them instead of rebuilding and re-sorting
+        """
+        cache = st.session_state.get('frame_cache')
+        if cache is None or cache['version'] != self.tracker.version:
+            cache = {
+                'version': self.tracker.version,
+                'frame': self.build_transactions_frame(self.tracker.get_transactions()),
+                'by_date': None
+            }
+            st.session_state.frame_cache = cache
+        return cache['frame']
+
+    def get_date_sorted_frame(self):
+        """Get the transactions frame sorted by date, sorting at most once per data version"""
+        frame = self.get_transactions_frame()
+        cache = st.session_state.frame_cache
+        if cache['by_date'] is None:
+            cache['by_date'] = frame.sort_values('date', kind='stable')
+        return cache['by_date']
+
+    def build_transactions_frame(self, transactions):
+        """Build the transactions DataFrame with a 'usd' column"""
+        # The tracker caches each transaction's USD amount, so no conversion here
+        frame = pd.DataFrame.from_records(transactions, columns=TRANSACTION_COLUMNS)
+        frame = frame.rename(columns={'amount_usd': 'usd'})
+        frame['date'] = frame['date'].fillna('')
+        frame['currency'] = frame['currency'].fillna('USD')
+        return frame
+
+    def render_sidebar(self, frame):
         """Render the sidebar with settings and controls"""
         st.sidebar.title("⚙️ Settings & Controls")
         
         # Base currency selection
         st.sidebar.subheader("💱 Base Currency")
-        currencies = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR", "BRL", "PKR"]
         st.session_state.base_currency = st.sidebar.selectbox(
             "Select base currency for conversions:",
-            currencies,
-            index=currencies.index(st.session_state.base_currency)
+            self.CURRENCIES,
+            index=self.CURRENCIES.index(st.session_state.base_currency)
         )
         
         # Data management
@@ -120,7 +388,7 @@ class StreamlitBudgetTracker:
         
         # Export data
         if st.sidebar.button("📥 Export Data to CSV"):
-            self.export_data()
+            self.export_data(frame)
         
         # Import data
         st.sidebar.subheader("📤 Import Data")
@@ -130,28 +398,34 @@ class StreamlitBudgetTracker:
             help="Upload a CSV file with transaction data"
         )
         
-        if uploaded_file is not None:
+        # The uploader keeps its file across reruns; import each upload only once
+        if uploaded_file is not None and uploaded_file.file_id not in st.session_state.imported_file_ids:
+            st.session_state.imported_file_ids.add(uploaded_file.file_id)
             self.import_data(uploaded_file)
         
+        if 'import_warning' in st.session_state:
+            st.sidebar.warning(st.session_state.pop('import_warning'))
+        
         # Clear all data
         st.sidebar.subheader("🗑️ Reset Data")
         if st.sidebar.button("Clear All Transactions", type="secondary"):
             if st.sidebar.checkbox("I understand this will delete all data"):
-                self.tracker.transactions = []
+                self.tracker.clear_all_transactions()
+                self.reset_transaction_log()
                 self.save_tracker()
                 st.rerun()
         
         # Statistics
         st.sidebar.subheader("📊 Quick Stats")
-        total_transactions = len(self.tracker.get_transactions())
+        total_transactions = self.tracker.get_transaction_count()
         st.sidebar.metric("Total Transactions", total_transactions)
         
         if total_transactions > 0:
             summary = self.tracker.get_summary()
             st.sidebar.metric(
                 "Net Balance", 
-                f"${summary['net_balance']:,.2f}",
-                delta=f"${summary['net_balance']:,.2f}" if summary['net_balance'] >= 0 else None
+                format_usd(summary['net_balance']),
+                delta=format_usd(summary['net_balance']) if summary['net_balance'] >= 0 else None
             )
 
     def render_transaction_input(self):
@@ -173,7 +447,7 @@ class StreamlitBudgetTracker:
                 
                 transaction_type = st.selectbox(
                     "Type",
-                    ["Income", "Expense"],
+                    self.TRANSACTION_TYPES,
                     help="Select transaction type"
                 )
             
@@ -193,7 +467,7 @@ class StreamlitBudgetTracker:
                 
                 currency = st.selectbox(
                     "Currency",
-                    ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR", "BRL", "PKR"],
+                    self.CURRENCIES,
                     help="Select transaction currency"
                 )
             
@@ -224,6 +498,7 @@ class StreamlitBudgetTracker:
                     )
                     
                     if success:
+                        self.append_to_transaction_log(1)
                         self.save_tracker()
                         st.success(f"✅ Added {transaction_type.lower()}: {category} - {currency} {amount:,.2f}")
                         st.rerun()
@@ -243,23 +518,23 @@ class StreamlitBudgetTracker:
         with col1:
             st.metric(
                 label="💰 Total Income",
-                value=f"${summary['total_income']:,.2f}",
-                delta=f"+${summary['total_income']:,.2f}" if summary['total_income'] > 0 else None
+                value=format_usd(summary['total_income']),
+                delta="+" + format_usd(summary['total_income']) if summary['total_income'] > 0 else None
             )
         
         with col2:
             st.metric(
                 label="💸 Total Expenses",
-                value=f"${summary['total_expenses']:,.2f}",
-                delta=f"-${summary['total_expenses']:,.2f}" if summary['total_expenses'] > 0 else None
+                value=format_usd(summary['total_expenses']),
+                delta="-" + format_usd(summary['total_expenses']) if summary['total_expenses'] > 0 else None
             )
         
         with col3:
             balance = summary['net_balance']
             st.metric(
                 label="💵 Net Balance",
-                value=f"${balance:,.2f}",
-                delta=f"${balance:,.2f}",
+                value=format_usd(balance),
+                delta=format_usd(balance),
                 delta_color="normal" if balance >= 0 else "inverse"
             )
         
@@ -278,33 +553,14 @@ class StreamlitBudgetTracker:
                     value="0.0%"
                 )
 
-    def render_transaction_history(self):
+    def render_transaction_history(self, frame):
         """Render the transaction history table with filtering"""
         st.subheader("📋 Transaction History")
         
-        transactions = self.tracker.get_transactions()
-        
-        if not transactions:
+        if frame.empty:
             st.info("No transactions found. Add your first transaction above!")
             return
         
-        # Create DataFrame
-        df_data = []
-        for t in transactions:
-            # Convert to base currency for comparison
-            usd_amount = self.tracker.convert_to_usd(t['amount'], t.get('currency', 'USD'))
-            
-            df_data.append({
-                'Date': t['date'][:10] if 'date' in t else 'N/A',
-                'Type': t['type'],
-                'Category': t['category'],
-                'Amount': f"{t.get('currency', 'USD')} {t['amount']:,.2f}",
-                'USD Equivalent': f"${usd_amount:.2f}",
-                'Currency': t.get('currency', 'USD')
-            })
-        
-        df = pd.DataFrame(df_data)
-        
         # Filtering options
         col1, col2 = st.columns(2)
         with col1:
@@ -315,19 +571,51 @@ class StreamlitBudgetTracker:
             )
         
         with col2:
-            categories = ["All"] + list(set(t['category'] for t in transactions))
+            categories = ["All"] + self.tracker.get_used_categories()
             category_filter = st.selectbox(
                 "Filter by Category:",
                 categories,
                 key="category_filter"
             )
         
-        # Apply filters
-        filtered_df = df.copy()
+        # Apply filters before formatting so excluded rows cost nothing
+        mask = pd.Series(True, index=frame.index)
         if type_filter != "All":
-            filtered_df = filtered_df[filtered_df['Type'] == type_filter]
+            mask &= frame['type'] == type_filter
         if category_filter != "All":
-            filtered_df = filtered_df[filtered_df['Category'] == category_filter]
+            mask &= frame['category'] == category_filter
+        filtered = frame.loc[mask]
+        
+        # Only the current page is formatted and sent to the browser
+        page_count = max(1, -(-len(filtered) // HISTORY_PAGE_SIZE))
+        if page_count > 1:
+            page = st.number_input(
+                f"Page (of {page_count}):",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                step=1,
+                # Per-filter key so a stale page number never exceeds a smaller range
+                key=f"history_page_{type_filter}_{category_filter}"
+            )
+            page_start = (int(page) - 1) * HISTORY_PAGE_SIZE
+            page_rows = filtered.iloc[page_start:page_start + HISTORY_PAGE_SIZE]
+        else:
+            page_rows = filtered
+        
+        # Create DataFrame with whole-column string operations
+        filtered_df = pd.DataFrame({
+            'Date': page_rows['date'].str.slice(0, 10).replace('', 'N/A'),
+            'Type': page_rows['type'],
+            'Category': page_rows['category'],
+            'Amount': page_rows['currency'] + ' ' + page_rows['amount'].map(format_amount),
+            'USD Equivalent': page_rows['usd'].map(format_usd_plain),
+            'Currency': page_rows['currency']
+        })
+        
+        # Arrow-backed columns go to the front end without a conversion pass
+        if ARROW_BACKEND:
+            filtered_df = filtered_df.convert_dtypes(dtype_backend='pyarrow')
         
         # Display table
         st.dataframe(
@@ -337,16 +625,14 @@ class StreamlitBudgetTracker:
         )
         
         # Summary of filtered data
-        if len(filtered_df) != len(df):
-            st.info(f"Showing {len(filtered_df)} of {len(df)} transactions")
+        if len(filtered) != len(frame):
+            st.info(f"Showing {len(filtered)} of {len(frame)} transactions")
 
-    def render_charts(self):
+    def render_charts(self, frame):
         """Render charts and visualizations"""
         st.subheader("📈 Financial Analytics")
         
-        transactions = self.tracker.get_transactions()
-        
-        if not transactions:
+        if frame.empty:
             st.info("Add some transactions to see charts and analytics!")
             return
         
@@ -354,161 +640,77 @@ class StreamlitBudgetTracker:
         tab1, tab2, tab3 = st.tabs(["💸 Expenses Breakdown", "📊 Income vs Expenses", "📈 Balance Trend"])
         
         with tab1:
-            self.render_expenses_pie_chart(transactions)
+            self.render_expenses_pie_chart(frame)
         
         with tab2:
-            self.render_income_expense_bar_chart(transactions)
+            self.render_income_expense_bar_chart(frame)
         
         with tab3:
-            self.render_balance_trend_chart(transactions)
+            self.render_balance_trend_chart(frame)
 
-    def render_expenses_pie_chart(self, transactions):
+    def render_expenses_pie_chart(self, frame):
         """Render expenses breakdown pie chart"""
-        expenses = [t for t in transactions if t['type'] == 'Expense']
+        fig = build_expenses_pie_chart(frame)
         
-        if not expenses:
+        if fig is None:
             st.info("No expense transactions to display.")
             return
         
-        # Group by category and convert to USD
-        expense_by_category = {}
-        for expense in expenses:
-            category = expense['category']
-            usd_amount = self.tracker.convert_to_usd(expense['amount'], expense.get('currency', 'USD'))
-            expense_by_category[category] = expense_by_category.get(category, 0) + usd_amount
-        
-        # Create pie chart
-        fig = px.pie(
-            values=list(expense_by_category.values()),
-            names=list(expense_by_category.keys()),
-            title="Expenses by Category (USD)",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        fig.update_layout(height=500)
-        
         st.plotly_chart(fig, use_container_width=True)
 
-    def render_income_expense_bar_chart(self, transactions):
+    def render_income_expense_bar_chart(self, frame):
         """Render income vs expenses bar chart"""
-        # Group by type and convert to USD
-        income_total = sum(
-            self.tracker.convert_to_usd(t['amount'], t.get('currency', 'USD'))
-            for t in transactions if t['type'] == 'Income'
-        )
-        
-        expense_total = sum(
-            self.tracker.convert_to_usd(t['amount'], t.get('currency', 'USD'))
-            for t in transactions if t['type'] == 'Expense'
-        )
-        
-        # Create bar chart
-        fig = go.Figure(data=[
-            go.Bar(
-                name='Income',
-                x=['Financial Overview'],
-                y=[income_total],
-                marker_color='lightgreen'
-            ),
-            go.Bar(
-                name='Expenses',
-                x=['Financial Overview'],
-                y=[expense_total],
-                marker_color='lightcoral'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Income vs Expenses (USD)",
-            barmode='group',
-            height=500,
-            yaxis_title="Amount (USD)"
-        )
+        # Group by type in USD with a single pass
+        totals = frame.groupby('type', sort=False)['usd'].sum()
+        income_total = totals.get('Income', 0.0)
+        expense_total = totals.get('Expense', 0.0)
         
+        fig = build_income_expense_bar_chart(float(income_total), float(expense_total))
         st.plotly_chart(fig, use_container_width=True)
         
         # Add summary below chart
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Total Income", f"${income_total:,.2f}")
+            st.metric("Total Income", format_usd(income_total))
         with col2:
-            st.metric("Total Expenses", f"${expense_total:,.2f}")
+            st.metric("Total Expenses", format_usd(expense_total))
 
-    def render_balance_trend_chart(self, transactions):
+    def render_balance_trend_chart(self, frame):
         """Render balance trend over time"""
-        if len(transactions) < 2:
+        if len(frame) < 2:
             st.info("Add more transactions to see balance trend over time.")
             return
         
-        # Sort transactions by date
-        sorted_transactions = sorted(transactions, key=lambda x: x.get('date', ''))
-        
-        # Calculate running balance
-        running_balance = 0
-        dates = []
-        balances = []
-        
-        for t in sorted_transactions:
-            usd_amount = self.tracker.convert_to_usd(t['amount'], t.get('currency', 'USD'))
-            if t['type'] == 'Income':
-                running_balance += usd_amount
-            else:
-                running_balance -= usd_amount
-            
-            dates.append(t.get('date', ''))
-            balances.append(running_balance)
-        
-        # Create line chart
-        df_chart = pd.DataFrame({'Date': dates, 'Balance': balances})
-        fig = px.line(
-            df_chart,
-            x='Date',
-            y='Balance',
-            title="Balance Trend Over Time (USD)"
-        )
-        
-        fig.update_traces(line_color='#1f77b4', line_width=3)
-        fig.update_layout(height=500)
-        fig.update_xaxes(title_text="Date")
-        fig.update_yaxes(title_text="Balance (USD)")
-        
-        # Add zero line
-        fig.add_hline(y=0, line_dash="dash", line_color="red", opacity=0.5)
-        
-        st.plotly_chart(fig, use_container_width=True)
+        sorted_frame = self.get_date_sorted_frame()[['date', 'type', 'usd']]
+        st.plotly_chart(build_balance_trend_chart(sorted_frame), use_container_width=True)
 
-    def export_data(self):
+    def export_data(self, frame):
         """Export transaction data to CSV"""
-        transactions = self.tracker.get_transactions()
-        
-        if not transactions:
+        if frame.empty:
             st.warning("No transactions to export.")
             return
         
         # Create DataFrame for export
-        df_data = []
-        for t in transactions:
-            df_data.append({
-                'Date': t.get('date', ''),
-                'Type': t['type'],
-                'Category': t['category'],
-                'Amount': t['amount'],
-                'Currency': t.get('currency', 'USD'),
-                'USD_Equivalent': self.tracker.convert_to_usd(t['amount'], t.get('currency', 'USD'))
-            })
-        
-        df = pd.DataFrame(df_data)
-        
-        # Convert to CSV
-        csv = df.to_csv(index=False)
+        df = pd.DataFrame({
+            'Date': frame['date'],
+            'Type': frame['type'],
+            'Category': frame['category'],
+            'Amount': frame['amount'],
+            'Currency': frame['currency'],
+            'USD_Equivalent': frame['usd']
+        })
+        
+        # Convert to CSV, compressing large ledgers
+        compress = len(df) > EXPORT_GZIP_THRESHOLD
+        csv = build_export_csv(df, compress)
+        file_name = f"budget_tracker_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
         # Create download button
         st.sidebar.download_button(
             label="💾 Download CSV",
             data=csv,
-            file_name=f"budget_tracker_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
+            file_name=file_name + ".gz" if compress else file_name,
+            mime="application/gzip" if compress else "text/csv"
         )
         
         st.sidebar.success("✅ Export ready! Click the download button above.")
@@ -516,8 +718,10 @@ class StreamlitBudgetTracker:
     def import_data(self, uploaded_file):
         """Import transaction data from CSV"""
         try:
-            # Read the uploaded file
-            df = pd.read_csv(uploaded_file)
+            # Read the uploaded file with the C engine: the pyarrow engine infers
+            # types before applying dtype, turning blank cells into 'None'/'NaT'
+            # strings and rewriting ISO timestamps
+            df = pd.read_csv(uploaded_file, dtype=IMPORT_DTYPES, low_memory=False)
             
             # Validate required columns
             required_columns = ['Type', 'Category', 'Amount']
@@ -527,23 +731,38 @@ class StreamlitBudgetTracker:
                 st.sidebar.error(f"Missing required columns: {', '.join(missing_columns)}")
                 return
             
-            # Import transactions
-            imported_count = 0
-            for _, row in df.iterrows():
-                try:
-                    success = self.tracker.add_transaction(
-                        amount=float(row['Amount']),
-                        category=str(row['Category']),
-                        transaction_type=str(row['Type']),
-                        currency=row.get('Currency', 'USD'),
-                        transaction_date=row.get('Date', datetime.now().strftime('%Y-%m-%d'))
-                    )
-                    if success:
-                        imported_count += 1
-                except Exception as e:
-                    st.sidebar.warning(f"Failed to import row: {e}")
+            # Validate and convert whole columns at once, then hand the
+            # surviving rows to the tracker in a single batch
+            today = datetime.now().strftime('%Y-%m-%d')
+            amounts = pd.to_numeric(df['Amount'], errors='coerce')
+            categories = df['Category'].fillna('').astype(str).str.strip()
+            types = df['Type'].astype(str)
+            valid = amounts.gt(0) & categories.ne('') & types.isin(self.TRANSACTION_TYPES)
+            
+            rows = pd.DataFrame({
+                'amount': amounts,
+                'category': categories,
+                'type': types,
+                'currency': df['Currency'].fillna('USD').astype(str) if 'Currency' in df.columns else 'USD',
+                'date': df['Date'].fillna(today).astype(str) if 'Date' in df.columns else today
+            }).loc[valid]
+            
+            rejected = []
+            imported_count = self.tracker.add_transactions(rows.to_dict('records'), rejected)
+            
+            # Rows dropped by the mask plus any the tracker rejected itself
+            skipped_index = valid.index[~valid].union(rows.index[rejected])
+            
+            # One summary for every skipped row instead of a warning per row;
+            # kept in session state so it survives the rerun below
+            skipped_count = len(skipped_index)
+            if skipped_count > 0:
+                invalid_lines = ', '.join(str(i + 2) for i in skipped_index[:5])  # +2: header, 1-based
+                more = ', ...' if skipped_count > 5 else ''
+                st.session_state.import_warning = f"⚠️ Skipped {skipped_count} invalid row(s) (CSV lines {invalid_lines}{more})"
             
             if imported_count > 0:
+                self.append_to_transaction_log(imported_count)
                 self.save_tracker()
                 st.sidebar.success(f"✅ Imported {imported_count} transactions successfully!")
                 st.rerun()
@@ -558,8 +777,11 @@ class StreamlitBudgetTracker:
         # Render header
         self.render_header()
         
+        # Convert amounts to USD once and share them across every render path
+        frame = self.get_transactions_frame()
+        
         # Render sidebar
-        self.render_sidebar()
+        self.render_sidebar(frame)
         
         # Main content area
         self.render_transaction_input()
@@ -568,10 +790,13 @@ class StreamlitBudgetTracker:
         self.render_summary_metrics()
         st.markdown("---")
         
-        self.render_transaction_history()
+        self.render_transaction_history(frame)
         st.markdown("---")
         
-        self.render_charts()
+        # Charts don't depend on the history filters; build them only on request
+        # so filter changes don't pay for them
+        if st.checkbox("📈 Show analytics", value=False, key="show_analytics"):
+            self.render_charts(frame)
         
         # Footer
         st.markdown("---")